@@ -42,6 +42,7 @@ from custom_components.midea_dehumidifier_lan.const import (
     DISCOVERY_LAN,
     DISCOVERY_WAIT,
     DOMAIN,
+    FLOW_JOBS,
     LOCAL_BROADCAST,
     NAME,
     CURRENT_CONFIG_VERSION,
@@ -55,6 +56,16 @@ from custom_components.midea_dehumidifier_lan.util import MideaClient, address_o
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reverse lookups used to migrate obsolete configurations. Built in reverse so
+# that first application in SUPPORTED_APPS wins when keys are shared.
+_APP_BY_APPKEY = {
+    appconf["appkey"]: appname
+    for appname, appconf in reversed(SUPPORTED_APPS.items())
+}
+_APP_BY_APPID = {
+    appconf["appid"]: appname for appname, appconf in reversed(SUPPORTED_APPS.items())
+}
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up platform from a ConfigEntry."""
@@ -113,6 +124,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hub: Hub = hass.data[DOMAIN].pop(entry.entry_id)
         await hub.async_unload()
+        if not hass.data[DOMAIN]:
+            # Last entry was unloaded, drop configuration flow job limit
+            hass.data.pop(FLOW_JOBS, None)
 
     return unload_ok
 
@@ -139,16 +153,12 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         else:
             appkey = old_conf.get(OBSOLETE_CONF_APPKEY, DEFAULT_APPKEY)
             if appkey:
-                for appname, appconf in SUPPORTED_APPS.items():
-                    if appconf["appkey"] == appkey:
-                        new_conf[CONF_MOBILE_APP] = appname
-                        break
+                appname = _APP_BY_APPKEY.get(appkey)
             else:
                 appid = old_conf.get(OBSOLETE_CONF_APPID, DEFAULT_APP_ID)
-                for appname, appconf in SUPPORTED_APPS.items():
-                    if appconf["appid"] == appid:
-                        new_conf[CONF_MOBILE_APP] = appname
-                        break
+                appname = _APP_BY_APPID.get(appid)
+            if appname:
+                new_conf[CONF_MOBILE_APP] = appname
 
         new_devices = []
         new_conf[CONF_DEVICES] = new_devices
@@ -155,7 +155,8 @@ class ApplianceEntity(CoordinatorEntity):
     """Represents an appliance that gets data from a coordinator"""
 
     _unique_id_prefx = UNIQUE_DEHUMIDIFIER_PREFIX
-    _name_suffix = ""
+    # Suffix to append to entity name
+    name_suffix = ""
     _capability_attr = ""
     _add_extra_attrs = False
     _was_online_registered = False
@@ -254,11 +255,6 @@ class ApplianceEntity(CoordinatorEntity):
             return False
         return super().available
 
-    @property
-    def name_suffix(self) -> str:
-        """Suffix to append to entity name"""
-        return self._name_suffix
-
     @property
     def unique_id_prefix(self) -> str:
         """Prefix for entity id"""
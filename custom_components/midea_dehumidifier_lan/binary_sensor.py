@@ -63,12 +63,12 @@ class TankFullSensor(ApplianceEntity, BinarySensorEntity):
     """
 
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _name_suffix = " Tank Full"
+    name_suffix = " Tank Full"
 
     def on_update(self) -> None:
+        dehumi = self.dehumidifier()
         self._attr_is_on = (
-            self.dehumidifier().tank_full
-            or self.dehumidifier().error_code == ERROR_CODE_BUCKET_FULL
+            dehumi.tank_full or dehumi.error_code == ERROR_CODE_BUCKET_FULL
         )
 
 
@@ -79,7 +79,7 @@ class TankRemovedSensor(ApplianceEntity, BinarySensorEntity):
     """
 
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _name_suffix = " Tank Removed"
+    name_suffix = " Tank Removed"
     _capability_attr = "pump"
 
     def on_update(self) -> None:
@@ -93,7 +93,7 @@ class FilterReplacementSensor(ApplianceEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_registry_enabled_default = False
-    _name_suffix = " Replace Filter"
+    name_suffix = " Replace Filter"
     _capability_attr = "filter"
 
     @property
@@ -112,7 +112,7 @@ class DefrostingSensor(ApplianceEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.COLD
     _attr_entity_registry_enabled_default = False
-    _name_suffix = " Defrosting"
+    name_suffix = " Defrosting"
 
     def on_update(self) -> None:
         self._attr_is_on = self.dehumidifier().defrosting
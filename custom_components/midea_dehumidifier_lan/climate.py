@@ -30,6 +30,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, PRECISION_HALVES, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from midea_beautiful.appliance import AirConditionerAppliance
 
 from custom_components.midea_dehumidifier_lan.appliance_coordinator import (
     ApplianceEntity,
@@ -104,6 +105,51 @@ _HVAC_ACTIONS = {
 }
 
 
+def _fan_mode(aircon: AirConditionerAppliance) -> str:
+    fan_speed = aircon.fan_speed
+    for mode, mode_speed in _FAN_SPEEDS.items():
+        if fan_speed <= mode_speed:
+            return mode
+    return FAN_AUTO
+
+
+def _preset_mode(aircon: AirConditionerAppliance) -> str:
+    if aircon.turbo:
+        return PRESET_BOOST
+    if aircon.eco_mode:
+        return PRESET_ECO
+    if aircon.comfort_sleep:
+        return PRESET_SLEEP
+    if aircon.frost_protect:
+        return PRESET_AWAY
+    if aircon.comfort_mode:
+        return PRESET_COMFORT
+    return PRESET_NONE
+
+
+def _swing_mode(aircon: AirConditionerAppliance) -> str:
+    if aircon.vertical_swing:
+        if aircon.horizontal_swing:
+            return SWING_BOTH
+        return SWING_VERTICAL
+    if aircon.horizontal_swing:
+        return SWING_HORIZONTAL
+    return SWING_OFF
+
+
+def _hvac_mode(aircon: AirConditionerAppliance) -> str:
+    if not aircon.running:
+        return HVACMode.OFF
+
+    curr_mode = aircon.mode
+    mode = _MIDEA_TO_MODES.get(curr_mode)
+    if mode is None:
+        mode = HVACMode.AUTO
+        _LOGGER.warning("Unknown mode %d, reporting %s", curr_mode, mode)
+
+    return mode
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -138,61 +184,20 @@ class AirConditionerEntity(ApplianceEntity, ClimateEntity):
         | ClimateEntityFeature.TURN_OFF
     )
 
-    _name_suffix = ""
+    name_suffix = ""
     _add_extra_attrs = True
 
     def on_update(self) -> None:
         aircon = self.airconditioner()
         self._attr_current_temperature = aircon.indoor_temperature
         self._attr_target_temperature = aircon.target_temperature
-        self._attr_fan_mode = self._fan_mode()
-        self._attr_preset_mode = self._preset_mode()
-        self._attr_swing_mode = self._swing_mode()
-        self._attr_hvac_mode = self._hvac_mode()
+        self._attr_fan_mode = _fan_mode(aircon)
+        self._attr_preset_mode = _preset_mode(aircon)
+        self._attr_swing_mode = _swing_mode(aircon)
+        self._attr_hvac_mode = _hvac_mode(aircon)
         self._attr_hvac_action = _HVAC_ACTIONS.get(self._attr_hvac_mode)
         super().on_update()
 
-    def _fan_mode(self) -> str:
-        fan_speed = self.airconditioner().fan_speed
-        for mode, mode_speed in _FAN_SPEEDS.items():
-            if fan_speed <= mode_speed:
-                return mode
-        return FAN_AUTO
-
-    def _preset_mode(self) -> str:
-        if self.airconditioner().turbo:
-            return PRESET_BOOST
-        if self.airconditioner().eco_mode:
-            return PRESET_ECO
-        if self.airconditioner().comfort_sleep:
-            return PRESET_SLEEP
-        if self.airconditioner().frost_protect:
-            return PRESET_AWAY
-        if self.airconditioner().comfort_mode:
-            return PRESET_COMFORT
-        return PRESET_NONE
-
-    def _swing_mode(self) -> str:
-        if self.airconditioner().vertical_swing:
-            if self.airconditioner().horizontal_swing:
-                return SWING_BOTH
-            return SWING_VERTICAL
-        if self.airconditioner().horizontal_swing:
-            return SWING_HORIZONTAL
-        return SWING_OFF
-
-    def _hvac_mode(self) -> str:
-        if not self.airconditioner().running:
-            return HVACMode.OFF
-
-        curr_mode = self.airconditioner().mode
-        mode = _MIDEA_TO_MODES.get(curr_mode)
-        if mode is None:
-            mode = HVACMode.AUTO
-            _LOGGER.warning("Unknown mode %d, reporting %s", curr_mode, mode)
-
-        return mode
-
     def turn_on(self, **kwargs) -> None:  # pylint: disable=unused-argument
         """Turn the entity on."""
         self.apply(ATTR_RUNNING, True)
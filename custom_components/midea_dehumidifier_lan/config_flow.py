@@ -1,7 +1,8 @@
 """Config flow for Midea Air Appliance (Local) integration."""
 from __future__ import annotations
 
-from ipaddress import IPv4Address, IPv4Network
+import asyncio
+from collections import deque
 import logging
 from typing import Any
 
@@ -67,6 +68,8 @@ from custom_components.midea_dehumidifier_lan.const import (
     DISCOVERY_MODE_LABELS,
     DISCOVERY_WAIT,
     DOMAIN,
+    FLOW_JOBS,
+    FLOW_MAX_PARALLEL_JOBS,
     LOCAL_BROADCAST,
     UNKNOWN_IP,
 )
@@ -175,13 +178,15 @@ class _MideaFlow(FlowHandler):
         self.appliances: list[LanDevice] = []
         self._client: MideaClient | None = None
         self.cloud: MideaCloud | None = None  # type: ignore
+        self.cloud_signature: int | None = None
         self.conf = {}
         self.config_entry: ConfigEntry | None = None
         self.devices_conf: list[dict[str, Any]] = []
         self.discovered_appliances: list[LanDevice | None] = []
         self.error_cause: str = ""
         self.errors: dict[str, Any] = {}
-        self.indexes_to_process = []
+        self.indexes_to_process: deque[int] = deque()
+        self.verified_appliances: dict[int, tuple[str, str, str, str]] = {}
 
     @property
     def client(self) -> MideaClient:
@@ -190,6 +195,19 @@ class _MideaFlow(FlowHandler):
             self._client = MideaClient(self.hass)
         return self._client
 
+    async def _async_add_executor_job(self, target, *args) -> Any:
+        """
+        Runs blocking cloud and network calls on Home Assistant executor.
+        Number of such calls made concurrently by configuration flows is
+        bounded, so that long discovery does not occupy shared executor.
+        """
+        semaphore: asyncio.Semaphore | None = self.hass.data.get(FLOW_JOBS)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(FLOW_MAX_PARALLEL_JOBS)
+            self.hass.data[FLOW_JOBS] = semaphore
+        async with semaphore:
+            return await self.hass.async_add_executor_job(target, *args)
+
     def _process_exception(self: _MideaFlow, ex: Exception) -> None:
         if isinstance(ex, _FlowException):
             _LOGGER.warning(
@@ -213,12 +231,17 @@ class _MideaFlow(FlowHandler):
             raise ex
 
     def _connect_to_cloud(self: _MideaFlow, extra_conf: dict[str, Any] = None) -> None:
-        """Validates that cloud credentials are valid"""
+        """Validates that cloud credentials are valid.
+        Existing session is reused if it was established using same credentials."""
         cfg = self.conf | (extra_conf or {})
+        signature = _cloud_signature(cfg)
+        if self.cloud is not None and signature == self.cloud_signature:
+            return
         try:
             self.cloud = self.client.connect_to_cloud(cfg)
         except MideaError as ex:
             raise _FlowException("no_cloud", str(ex)) from ex
+        self.cloud_signature = signature
 
     def _validate_appliance(
         self: _MideaFlow, appliance: LanDevice, device_conf: dict
@@ -245,16 +268,8 @@ class _MideaFlow(FlowHandler):
                     use_cloud=True,
                 )
             else:  # DISCOVERY_LAN
-                ip_address = appliance.address
-                if not address_ok(ip_address):
-                    raise _FlowException("invalid_ip_address", ip_address)
-                try:
-                    IPv4Address(ip_address)
-                except Exception as ex:
-                    _LOGGER.debug("Invalid appliance address %s: %s", ip_address, ex)
-                    raise _FlowException("invalid_ip_address", ip_address) from ex
                 discovered = self.client.appliance_state(
-                    address=ip_address, cloud=self.cloud
+                    address=appliance.address, cloud=self.cloud
                 )
         except ProtocolError as ex:
             raise _FlowException("connection_error", str(ex)) from ex
@@ -269,33 +284,13 @@ class _MideaFlow(FlowHandler):
         return discovered
 
     async def _async_add_entry(self: _MideaFlow) -> FlowResult:
-        supported_devices_conf = []
-        for i, appliance in enumerate(self.appliances):
-            if not supported_appliance(self.conf, appliance):
-                continue
-            device_conf = self.devices_conf[i]
-
-            if device_conf.get(CONF_DISCOVERY) != DISCOVERY_IGNORE:
-                device_conf |= {
-                    CONF_API_VERSION: appliance.version,
-                    CONF_ID: appliance.appliance_id,
-                    CONF_IP_ADDRESS: (
-                        appliance.address or device_conf[CONF_IP_ADDRESS] or UNKNOWN_IP
-                    ),
-                    CONF_NAME: appliance.name,
-                    CONF_TOKEN_KEY: appliance.key,
-                    CONF_TOKEN: appliance.token,
-                    CONF_TYPE: appliance.type,
-                    CONF_UNIQUE_ID: appliance.serial_number,
-                }
-                suggested_discovery = (
-                    DISCOVERY_LAN
-                    if address_ok(device_conf[CONF_IP_ADDRESS])
-                    else DISCOVERY_WAIT
-                )
-                device_conf.get(CONF_DISCOVERY, suggested_discovery)
-                supported_devices_conf.append(device_conf)
-        self.devices_conf = supported_devices_conf
+        conf = self.conf
+        self.devices_conf = [
+            _entry_device_conf(appliance, device_conf)
+            for appliance, device_conf in zip(self.appliances, self.devices_conf)
+            if supported_appliance(conf, appliance)
+            and device_conf.get(CONF_DISCOVERY) != DISCOVERY_IGNORE
+        ]
         self.conf[CONF_DEVICES] = self.devices_conf
 
         # Remove not used elements
@@ -355,14 +350,24 @@ class _MideaFlow(FlowHandler):
                 appliance.token = user_input.get(CONF_TOKEN, "")
                 appliance.key = user_input.get(CONF_TOKEN_KEY, "")
 
-                if not self.cloud:
-                    await self.hass.async_add_executor_job(self._connect_to_cloud)
+                # Reject malformed address before any network round-trip
+                if discovery_mode == DISCOVERY_LAN and not (
+                    address_ok(ip_address) and _is_valid_ipv4(ip_address)
+                ):
+                    raise _FlowException("invalid_ip_address", ip_address)
 
-                discovered = await self.hass.async_add_executor_job(
-                    self._validate_appliance,
-                    appliance,
-                    device_conf,
-                )
+                if self._is_verified(appliance, discovery_mode):
+                    _LOGGER.debug("Appliance %s is online, not probing it", appliance)
+                    discovered = None
+                else:
+                    if not self.cloud:
+                        await self._async_add_executor_job(self._connect_to_cloud)
+
+                    discovered = await self._async_add_executor_job(
+                        self._validate_appliance,
+                        appliance,
+                        device_conf,
+                    )
                 self.discovered_appliances[self.appliance_idx] = discovered
 
                 if not self.indexes_to_process:
@@ -370,7 +375,7 @@ class _MideaFlow(FlowHandler):
 
                     return await self._async_add_entry()
 
-                self.appliance_idx = self.indexes_to_process.pop(0)
+                self.appliance_idx = self.indexes_to_process.popleft()
                 appliance = self.appliances[self.appliance_idx]
                 device_conf = self.devices_conf[self.appliance_idx]
                 ip_address = appliance.address or UNKNOWN_IP
@@ -405,6 +410,19 @@ class _MideaFlow(FlowHandler):
             last_step=len(self.indexes_to_process) == 0,
         )
 
+    def _is_verified(self, appliance: LanDevice, discovery_mode: str) -> bool:
+        """
+        Returns True if appliance was online over LAN when flow started and
+        it stays in LAN mode with same address and credentials, so it doesn't
+        need to be probed again
+        """
+        return self.verified_appliances.get(self.appliance_idx) == (
+            discovery_mode,
+            appliance.address,
+            appliance.token,
+            appliance.key,
+        ) and discovery_mode == DISCOVERY_LAN
+
     def _check_ip_address_unique(self, ip_address) -> None:
         if address_ok(ip_address):
             for i in range(self.appliance_idx):
@@ -441,23 +459,140 @@ class _MideaFlow(FlowHandler):
         return placeholders
 
 
-def _get_broadcast_addresses(user_input: dict[str, Any]) -> list[str]:
+def _unique_by_address(appliances: list[LanDevice]) -> list[LanDevice]:
+    """Removes appliances reported more than once on same address.
+    Appliances without known address are kept."""
+    seen: set[str] = set()
+    unique = []
+    for appliance in appliances:
+        address = appliance.address
+        if address_ok(address):
+            if address in seen:
+                _LOGGER.debug("Duplicate appliance %s on %s", appliance, address)
+                continue
+            seen.add(address)
+        unique.append(appliance)
+    return unique
+
+
+def _cloud_signature(conf: dict[str, Any]) -> int:
+    """Identifies credentials used to connect to Midea cloud"""
+    return hash(
+        (conf.get(CONF_USERNAME), conf.get(CONF_PASSWORD), conf.get(CONF_MOBILE_APP))
+    )
+
+
+def _entry_device_conf(appliance: LanDevice, device_conf: dict) -> dict[str, Any]:
+    """Updates appliance configuration with appliance data"""
+    device_conf |= {
+        CONF_API_VERSION: appliance.version,
+        CONF_ID: appliance.appliance_id,
+        CONF_IP_ADDRESS: (
+            appliance.address or device_conf.get(CONF_IP_ADDRESS) or UNKNOWN_IP
+        ),
+        CONF_NAME: appliance.name,
+        CONF_TOKEN_KEY: appliance.key,
+        CONF_TOKEN: appliance.token,
+        CONF_TYPE: appliance.type,
+        CONF_UNIQUE_ID: appliance.serial_number,
+    }
+    return device_conf
+
+
+def _parse_ipv4(address: str) -> int:
+    """Parses dotted-quad IPv4 address into integer without allocating
+    intermediate objects. Returns -1 if address is not valid."""
+    if address.count(".") != 3:
+        return -1
+    value = 0
+    octet = -1
+    for char in address:
+        if char == ".":
+            if octet < 0:
+                return -1
+            value = (value << 8) | octet
+            octet = -1
+        elif "0" <= char <= "9":
+            # Leading zeros are not permitted
+            if octet == 0:
+                return -1
+            octet = (octet if octet > 0 else 0) * 10 + ord(char) - 48
+            if octet > 255:
+                return -1
+        else:
+            return -1
+    if octet < 0:
+        return -1
+    return (value << 8) | octet
+
+
+def _is_valid_ipv4(address: str) -> bool:
+    """Returns True if address is valid dotted-quad IPv4 address"""
+    return _parse_ipv4(address) >= 0
+
+
+def _format_ipv4(value: int) -> str:
+    """Formats integer as dotted-quad IPv4 address"""
+    return f"{value >> 24}.{(value >> 16) & 0xFF}.{(value >> 8) & 0xFF}.{value & 0xFF}"
+
+
+def _parse_ipv4_mask(prefix: str) -> int:
+    """Parses prefix length, dotted netmask or dotted hostmask into netmask
+    integer. Returns -1 if prefix is not valid."""
+    if prefix.isascii() and prefix.isdigit():
+        prefix_len = int(prefix)
+        if prefix_len > 32:
+            return -1
+        return (0xFFFFFFFF << (32 - prefix_len)) & 0xFFFFFFFF
+    mask = _parse_ipv4(prefix)
+    if mask < 0:
+        return -1
+    host_mask = ~mask & 0xFFFFFFFF
+    # Netmask has contiguous leading ones, hostmask contiguous trailing ones
+    if host_mask & (host_mask + 1) == 0:
+        return mask
+    if mask & (mask + 1) == 0:
+        return host_mask
+    return -1
+
+
+def _parse_ipv4_network(network: str) -> tuple[int, int] | None:
+    """Parses IPv4 address or network into (network, mask) integers.
+    Accepts same notations as strict ``IPv4Network``: prefix length, netmask
+    or hostmask, and host bits must not be set.
+    Returns None if network is not valid."""
+    address, separator, prefix = network.partition("/")
+    value = _parse_ipv4(address)
+    if value < 0:
+        return None
+    if not separator:
+        return value, 0xFFFFFFFF
+    mask = _parse_ipv4_mask(prefix)
+    if mask < 0 or value & ~mask:
+        return None
+    return value, mask
+
+
+def _is_valid_ipv4_network(network: str) -> bool:
+    """Returns True if network is valid IPv4 address or network in CIDR notation"""
+    return _parse_ipv4_network(network) is not None
+
+
+def _get_broadcast_ranges(user_input: dict[str, Any]) -> dict[str, tuple[int, int]]:
+    """Returns network ranges used for discovery mapped to their parsed
+    (network, mask) form"""
     address_entry = str(user_input.get(CONF_BROADCAST_ADDRESS, ""))
-    addresses = [LOCAL_BROADCAST]
+    ranges = {LOCAL_BROADCAST: (0xFFFFFFFF, 0xFFFFFFFF)}
     specified_addresses = [
         addr.strip() for addr in address_entry.split(",") if addr.strip()
     ]
     for addr in specified_addresses:
         _LOGGER.debug("Trying IPv4 %s", addr)
-        try:
-            IPv4Network(addr)
-            addresses.append(addr)
-        except ValueError as ex:
-            raise _FlowException("invalid_ip_range", str(ex)) from ex
-        except Exception as ex:
-            _LOGGER.debug("Invalid IP address %s", addr, exc_info=True)
-            raise _FlowException("invalid_ip_range", addr) from ex
-    return addresses
+        parsed = _parse_ipv4_network(addr)
+        if parsed is None:
+            raise _FlowException("invalid_ip_range", addr)
+        ranges[addr] = parsed
+    return ranges
 
 
 class _FlowException(Exception):
@@ -483,6 +618,9 @@ class MideaConfigFlow(ConfigFlow, _MideaFlow, domain=DOMAIN):
         self.appliances: list[LanDevice] = []
         self.config_entry: ConfigEntry | None = None
         self.advanced_settings = False
+        self.cloud_prefetch: asyncio.Task[MideaCloud | None] | None = None
+        self.cloud_prefetch_conf: dict[str, Any] = {}
+        self.broadcast_ranges: list[tuple[int, int]] = []
 
     @staticmethod
     @callback
@@ -496,16 +634,54 @@ class MideaConfigFlow(ConfigFlow, _MideaFlow, domain=DOMAIN):
         """Validates that cloud credentials are valid and discovers local appliances"""
 
         self._connect_to_cloud()
-        conf_addresses = self.conf.get(CONF_BROADCAST_ADDRESS, [])
-        if isinstance(conf_addresses, str):
-            conf_addresses = [conf_addresses]
         addresses = [
-            str(IPv4Network(addr).broadcast_address) for addr in conf_addresses
+            _format_ipv4(network | (~mask & 0xFFFFFFFF))
+            for network, mask in self.broadcast_ranges
         ]
         self.appliances.clear()
-        self.appliances += self.client.find_appliances(self.cloud, addresses)
+        self.appliances += _unique_by_address(
+            self.client.find_appliances(self.cloud, addresses)
+        )
         self.devices_conf = [{} for _ in self.appliances]
 
+    def _start_cloud_prefetch(self) -> None:
+        """Starts login to Midea cloud while user fills advanced settings form"""
+        self.cloud_prefetch_conf = {
+            CONF_USERNAME: self.conf[CONF_USERNAME],
+            CONF_PASSWORD: self.conf[CONF_PASSWORD],
+            CONF_MOBILE_APP: self.conf[CONF_MOBILE_APP],
+        }
+        self.cloud_prefetch = self.hass.async_create_task(self._async_prefetch_cloud())
+
+    async def _async_prefetch_cloud(self) -> MideaCloud | None:
+        """Logs in to Midea cloud in background. Failure is not reported here,
+        login is retried and any error reported during discovery."""
+        try:
+            return await self._async_add_executor_job(
+                self.client.connect_to_cloud, self.cloud_prefetch_conf
+            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Prefetched login to Midea cloud failed", exc_info=True)
+            return None
+
+    async def _async_use_prefetched_cloud(self) -> None:
+        """Adopts cloud session established while advanced settings form was
+        shown. It is reused only if credentials didn't change since."""
+        if self.cloud_prefetch is None:
+            return
+        prefetch, self.cloud_prefetch = self.cloud_prefetch, None
+        if cloud := await prefetch:
+            self.cloud = cloud
+            self.cloud_signature = _cloud_signature(self.cloud_prefetch_conf)
+
+    @callback
+    def async_remove(self) -> None:
+        """Cancels background login if flow ends before it was used"""
+        if self.cloud_prefetch is not None:
+            self.cloud_prefetch.cancel()
+            self.cloud_prefetch = None
+        super().async_remove()
+
     async def _validate_discovery_phase(
         self, user_input: dict[str, Any] | None
     ) -> FlowResult:
@@ -519,29 +695,34 @@ class MideaConfigFlow(ConfigFlow, _MideaFlow, domain=DOMAIN):
             self.conf[CONF_INCLUDE] = user_input[CONF_INCLUDE]
             self.conf[CONF_SCAN_INTERVAL] = user_input[CONF_SCAN_INTERVAL]
             self.conf[CONF_DEBUG] = user_input[CONF_DEBUG]
-            self.conf[CONF_BROADCAST_ADDRESS] = _get_broadcast_addresses(user_input)
+            ranges = _get_broadcast_ranges(user_input)
+            self.conf[CONF_BROADCAST_ADDRESS] = list(ranges)
+            self.broadcast_ranges = list(ranges.values())
 
         else:
             self.conf[CONF_MOBILE_APP] = user_input.get(CONF_MOBILE_APP, DEFAULT_APP)
             if user_input.get(CONF_ADVANCED_SETTINGS):
+                self._start_cloud_prefetch()
                 return await self.async_step_advanced_settings()
 
             self.conf[CONF_BROADCAST_ADDRESS] = []
+            self.broadcast_ranges = []
             self.conf[CONF_INCLUDE] = [APPLIANCE_TYPE_DEHUMIDIFIER]
             self.conf[CONF_SCAN_INTERVAL] = DEFAULT_SCAN_INTERVAL
 
         if self.conf.get(CONF_DEBUG, False):
             await self.client.async_debug_mode(True)
-        await self.hass.async_add_executor_job(self._connect_and_discover)
+        await self._async_use_prefetched_cloud()
+        await self._async_add_executor_job(self._connect_and_discover)
 
-        self.indexes_to_process = [
+        self.indexes_to_process = deque(
             index
             for index, appliance in enumerate(self.appliances)
             if supported_appliance(self.conf, appliance)
             and not address_ok(appliance.address)
-        ]
+        )
         if self.indexes_to_process:
-            self.appliance_idx = self.indexes_to_process.pop(0)
+            self.appliance_idx = self.indexes_to_process.popleft()
             self.discovered_appliances = [None] * len(self.devices_conf)
             return await self.async_step_unreachable_appliance()
 
@@ -601,7 +782,9 @@ class MideaConfigFlow(ConfigFlow, _MideaFlow, domain=DOMAIN):
         password = user_input.get(
             CONF_PASSWORD, self.conf.get(CONF_PASSWORD, DEFAULT_PASSWORD)
         )
-        app = user_input.get(CONF_MOBILE_APP, DEFAULT_APP)
+        app = user_input.get(
+            CONF_MOBILE_APP, self.conf.get(CONF_MOBILE_APP, DEFAULT_APP)
+        )
         broadcast_addresses = user_input.get(
             CONF_BROADCAST_ADDRESS, ",".join(self.conf.get(CONF_BROADCAST_ADDRESS, []))
         )
@@ -654,7 +837,7 @@ class MideaConfigFlow(ConfigFlow, _MideaFlow, domain=DOMAIN):
                 CONF_MOBILE_APP: user_input.get(CONF_MOBILE_APP, app),
             }
             try:
-                await self.hass.async_add_executor_job(
+                await self._async_add_executor_job(
                     self._connect_to_cloud, extra_conf
                 )
             except Exception as ex:  # pylint: disable=broad-except
@@ -707,11 +890,20 @@ class MideaOptionsFlow(OptionsFlow, _MideaFlow):
         assert self.config_entry
         hub: Hub = self.hass.data[DOMAIN][self.config_entry.entry_id]
         self.appliances.clear()
+        self.verified_appliances.clear()
         self.devices_conf = self.conf[CONF_DEVICES]
         for device in self.devices_conf:
             for coord in hub.coordinators:
-                if device[CONF_UNIQUE_ID] == coord.appliance.serial_number:
-                    self.appliances.append(coord.appliance)
+                appliance = coord.appliance
+                if device[CONF_UNIQUE_ID] == appliance.serial_number:
+                    if coord.available and appliance.online:
+                        self.verified_appliances[len(self.appliances)] = (
+                            device.get(CONF_DISCOVERY),
+                            appliance.address,
+                            appliance.token,
+                            appliance.key,
+                        )
+                    self.appliances.append(appliance)
                     break
             else:
                 appliance = LanDevice(
@@ -722,6 +914,6 @@ class MideaOptionsFlow(OptionsFlow, _MideaFlow):
                 appliance.name = device[CONF_NAME]
                 appliance.address = device.get(CONF_IP_ADDRESS, UNKNOWN_IP)
                 self.appliances.append(appliance)
-        self.indexes_to_process = list(range(len(self.appliances)))
-        self.appliance_idx = self.indexes_to_process.pop(0)
+        self.indexes_to_process = deque(range(len(self.appliances)))
+        self.appliance_idx = self.indexes_to_process.popleft()
         self.discovered_appliances = [None] * len(self.devices_conf)
@@ -71,6 +71,12 @@ DISCOVERY_WAIT = "WAIT"
 DEFAULT_DISCOVERY_MODE = DISCOVERY_LAN
 
 DISCOVERY_BATCH_SIZE: Final = 64
+# Maximum number of blocking calls configuration flows run at the same time
+FLOW_MAX_PARALLEL_JOBS: Final = 4
+# Key of semaphore bounding configuration flow calls in hass.data
+FLOW_JOBS: Final = f"{DOMAIN}_flow_jobs"
+# Maximum number of appliances probed at the same time during set-up
+SETUP_MAX_PARALLEL_PROBES: Final = 8
 
 DEFAULT_APP: Final = DEFAULT_APP_FROM_LIB
 
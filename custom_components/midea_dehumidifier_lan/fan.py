@@ -14,7 +14,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from custom_components.midea_dehumidifier_lan.const import ATTR_FAN_SPEED, DOMAIN
 from custom_components.midea_dehumidifier_lan.appliance_coordinator import (
     ApplianceEntity,
-    ApplianceUpdateCoordinator,
 )
 from custom_components.midea_dehumidifier_lan.hub import Hub
 
@@ -32,6 +31,14 @@ PRESET_MODES_2: Final = [MODE_AUTO]
 
 _FAN_SPEEDS = {2: PRESET_MODES_2, 3: PRESET_MODES_3, 7: PRESET_MODES_7}
 _ON_SPEED = {2: MODE_AUTO, 3: MODE_HIGH, 7: MODE_HIGH}
+# Upper fan speed of each preset mode
+_PRESET_SPEEDS: Final = {
+    MODE_NONE: 0,
+    MODE_LOW: 40,
+    MODE_MEDIUM: 60,
+    MODE_HIGH: 80,
+    MODE_AUTO: 101,
+}
 
 
 async def async_setup_entry(
@@ -60,20 +67,9 @@ class DehumidiferFan(ApplianceEntity, FanEntity):
 
     _attr_preset_modes = PRESET_MODES_7
     _attr_speed_count = len(PRESET_MODES_7)
-    _name_suffix = " Fan"
+    name_suffix = " Fan"
     _on_speed = MODE_MEDIUM
 
-    def __init__(self, coordinator: ApplianceUpdateCoordinator) -> None:
-
-        super().__init__(coordinator)
-        self._fan_speeds = {
-            MODE_NONE: 0,
-            MODE_LOW: 40,
-            MODE_MEDIUM: 60,
-            MODE_HIGH: 80,
-            MODE_AUTO: 101,
-        }
-
     @property
     def is_on(self):
         # Override parent logic
@@ -90,8 +86,8 @@ class DehumidiferFan(ApplianceEntity, FanEntity):
     def on_update(self) -> None:
         fan_speed = self.dehumidifier().fan_speed
         self._attr_percentage = fan_speed
-        self._attr_is_on = fan_speed > self._fan_speeds[MODE_LOW]
-        for mode, mode_speed in self._fan_speeds.items():
+        self._attr_is_on = fan_speed > _PRESET_SPEEDS[MODE_LOW]
+        for mode, mode_speed in _PRESET_SPEEDS.items():
             if fan_speed <= mode_speed:
                 self._attr_preset_mode = mode
                 break
@@ -100,7 +96,7 @@ class DehumidiferFan(ApplianceEntity, FanEntity):
 
     def set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the fan."""
-        speed = self._fan_speeds.get(preset_mode, None)
+        speed = _PRESET_SPEEDS.get(preset_mode, None)
         _LOGGER.debug("Setting speed to %s", speed)
         if speed is not None:
             self.apply(ATTR_FAN_SPEED, speed)
@@ -134,7 +130,7 @@ class DehumidiferFan(ApplianceEntity, FanEntity):
         # _LOGGER.debug("turn_on percentage=%s was_updated=%s", self._attr_percentage, updated)
         if (
             not updated
-            and (self._attr_percentage or 0) < self._fan_speeds[self._on_speed]
+            and (self._attr_percentage or 0) < _PRESET_SPEEDS[self._on_speed]
         ):
             self.set_preset_mode(self._on_speed)
 
@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Tuple
+from typing import Any, Awaitable, Callable, Tuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -38,6 +39,7 @@ from custom_components.midea_dehumidifier_lan.const import (
     DISCOVERY_LAN,
     DISCOVERY_WAIT,
     NAME,
+    SETUP_MAX_PARALLEL_PROBES,
     UNKNOWN_IP,
 )
 from custom_components.midea_dehumidifier_lan.util import (
@@ -99,6 +101,33 @@ def _get_placeholder_appliance(device: dict[str, Any]) -> LanDevice:
     return appliance
 
 
+async def _async_run_bounded(
+    func: Callable[[Any], Awaitable[Any]], items: list[Any]
+) -> list[Any]:
+    """Calls ``func`` for each of items concurrently, with at most
+    SETUP_MAX_PARALLEL_PROBES calls running at the same time, in order not to
+    flood local network or cloud API. Returns results in order of items.
+    If any of calls fails, remaining ones are cancelled and the first failure
+    is raised."""
+    semaphore = asyncio.Semaphore(SETUP_MAX_PARALLEL_PROBES)
+
+    async def _async_bounded(item: Any) -> Any:
+        async with semaphore:
+            return await func(item)
+
+    tasks = [asyncio.create_task(_async_bounded(item)) for item in items]
+    if not tasks:
+        return []
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        raise
+    return [task.result() for task in tasks]
+
+
 class Hub(AbstractHub):  # pylint: disable=too-many-instance-attributes
     """Central class for interacting with appliances"""
 
@@ -107,6 +136,7 @@ class Hub(AbstractHub):  # pylint: disable=too-many-instance-attributes
         self.discovery = ApplianceDiscoveryHelper(self)
         self.coordinators: list[ApplianceUpdateCoordinator] = []
         self.updated_conf = False
+        self._cloud_lock = asyncio.Lock()
 
     async def async_unload(self) -> None:
         """Stops discovery and coordinators"""
@@ -132,14 +162,23 @@ class Hub(AbstractHub):  # pylint: disable=too-many-instance-attributes
         self.errors = {}
         self.updated_conf = False
 
-        devices = []
-        for device in self.config[CONF_DEVICES]:
+        for device in devices:
             if not _assure_valid_device_configuration(self.config, device):
                 self.updated_conf = True
-            coordinator = await self._process_appliance(device)
-            if coordinator and coordinator.available:
-                await coordinator.async_config_entry_first_refresh()
-            devices.append(device)
+
+        probes = await _async_run_bounded(self._async_probe_appliance, devices)
+        available = []
+        for device, probe in zip(devices, probes):
+            if probe is None:
+                continue
+            need_token, appliance = probe
+            coordinator = self._create_coordinator(appliance, device, need_token)
+            if coordinator.available:
+                available.append(coordinator)
+
+        await _async_run_bounded(
+            ApplianceUpdateCoordinator.async_config_entry_first_refresh, available
+        )
 
         if self.updated_conf:
             await self.async_update_config()
@@ -155,9 +194,9 @@ class Hub(AbstractHub):  # pylint: disable=too-many-instance-attributes
             for unique_id, error in self.errors.items():
                 _LOGGER.warning("Device may be offline or unreachable, trying again later. %s", error)
 
-    async def _process_appliance(
+    async def _async_probe_appliance(
         self, device: dict[str, Any]
-    ) -> ApplianceUpdateCoordinator | None:
+    ) -> Tuple[bool, LanDevice | None] | None:
         discovery_mode = device.get(CONF_DISCOVERY)
         # We are waiting for appliance to come online
         if discovery_mode == DISCOVERY_IGNORE:
@@ -166,10 +205,7 @@ class Hub(AbstractHub):  # pylint: disable=too-many-instance-attributes
         if discovery_mode == DISCOVERY_WAIT:
             _LOGGER.debug("Waiting for appliance discovery %s", device)
             return None
-        need_token, appliance = await self.async_discover_device(
-            device, initial_discovery=True
-        )
-        return self._create_coordinator(appliance, device, need_token)
+        return await self.async_discover_device(device, initial_discovery=True)
 
     async def async_discover_device(
         self, device: dict[str, Any], initial_discovery=False
@@ -242,16 +278,21 @@ class Hub(AbstractHub):  # pylint: disable=too-many-instance-attributes
         self, device: dict[str, Any], need_cloud: bool, need_token: bool
     ) -> bool:
         if need_cloud and self.cloud is None:
-            self._validate_auth_config_complete(device, need_token)
-            try:
-                self.cloud = await self.client.async_connect_to_cloud(self.config)
-            except AuthenticationError as ex:
-                raise ConfigEntryAuthFailed(
-                    f"Unable to login to Midea cloud {ex}"
-                ) from ex
-            except Exception as ex:  # pylint: disable=broad-except
-                self.errors[device[CONF_UNIQUE_ID]] = str(ex)
-                return False
+            # Appliances may be discovered concurrently, login only once
+            async with self._cloud_lock:
+                if self.cloud is None:
+                    self._validate_auth_config_complete(device, need_token)
+                    try:
+                        self.cloud = await self.client.async_connect_to_cloud(
+                            self.config
+                        )
+                    except AuthenticationError as ex:
+                        raise ConfigEntryAuthFailed(
+                            f"Unable to login to Midea cloud {ex}"
+                        ) from ex
+                    except Exception as ex:  # pylint: disable=broad-except
+                        self.errors[device[CONF_UNIQUE_ID]] = str(ex)
+                        return False
         return True
 
     def _validate_auth_config_complete(self, device, need_token):
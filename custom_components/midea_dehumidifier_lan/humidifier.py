@@ -47,20 +47,22 @@ async def async_setup_entry(
     )
 
 
-_MODES = [
-    (1, MODE_SET),
-    (2, MODE_CONTINOUS),
-    (3, MODE_SMART),
-    (4, MODE_DRY),
-    (6, MODE_PURIFIER),
-    (7, MODE_ANTIMOULD),
-]
-
-_MODES_FROM_CAPABILITY = {
-    1: [MODE_PURIFIER],
-    2: [MODE_ANTIMOULD],
-    3: [MODE_PURIFIER, MODE_ANTIMOULD],
-    4: [MODE_FAN],
+_MODE_CODE_TO_NAME: Final = {
+    1: MODE_SET,
+    2: MODE_CONTINOUS,
+    3: MODE_SMART,
+    4: MODE_DRY,
+    6: MODE_PURIFIER,
+    7: MODE_ANTIMOULD,
+}
+
+_MODE_NAME_TO_CODE: Final = {name: code for code, name in _MODE_CODE_TO_NAME.items()}
+
+_MODES_FROM_CAPABILITY: Final = {
+    1: (MODE_PURIFIER,),
+    2: (MODE_ANTIMOULD,),
+    3: (MODE_PURIFIER, MODE_ANTIMOULD),
+    4: (MODE_FAN,),
 }
 
 
@@ -72,7 +74,7 @@ class DehumidifierEntity(ApplianceEntity, HumidifierEntity):
     _attr_max_humidity = MAX_TARGET_HUMIDITY
     _attr_min_humidity = MIN_TARGET_HUMIDITY
     _attr_supported_features = HumidifierEntityFeature.MODES
-    _name_suffix = ""
+    name_suffix = ""
     _add_extra_attrs = True
 
     def __init__(self, coordinator: ApplianceUpdateCoordinator) -> None:
@@ -84,21 +86,23 @@ class DehumidifierEntity(ApplianceEntity, HumidifierEntity):
     def on_online(self, update: bool) -> None:
         capabilities = self.coordinator.appliance.state.capabilities
 
-        self._attr_available_modes = [MODE_SET]
+        modes = [MODE_SET]
         if capabilities.get("auto"):
-            self._attr_available_modes.append(MODE_SMART)
-        self._attr_available_modes.append(MODE_CONTINOUS)
+            modes.append(MODE_SMART)
+        modes.append(MODE_CONTINOUS)
         if capabilities.get("dry_clothes"):
-            self._attr_available_modes.append(MODE_DRY)
+            modes.append(MODE_DRY)
 
         more_modes = capabilities.get("mode", 0)
-        self._attr_available_modes += _MODES_FROM_CAPABILITY.get(more_modes, [])
+        modes += _MODES_FROM_CAPABILITY.get(more_modes, ())
+        # Built in a new list, so previously published modes are never mutated
+        self._attr_available_modes = modes
 
         super().on_online(update)
 
     def on_update(self) -> None:
         dehumi = self.dehumidifier()
-        self._attr_mode = next((i[1] for i in _MODES if i[0] == dehumi.mode), MODE_SET)
+        self._attr_mode = _MODE_CODE_TO_NAME.get(dehumi.mode, MODE_SET)
         self._attr_target_humidity = dehumi.target_humidity
         self._attr_current_humidity = dehumi.current_humidity # add new attribute current_humidity
         self._attr_is_on = dehumi.running
@@ -114,7 +118,7 @@ class DehumidifierEntity(ApplianceEntity, HumidifierEntity):
 
     def set_mode(self, mode) -> None:
         """Set new target preset mode."""
-        midea_mode = next((i[0] for i in _MODES if i[1] == mode), None)
+        midea_mode = _MODE_NAME_TO_CODE.get(mode)
         if midea_mode is None:
             _LOGGER.debug("Unsupported dehumidifer mode %s", mode)
             midea_mode = 1
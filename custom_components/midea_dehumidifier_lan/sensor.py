@@ -53,7 +53,7 @@ class CurrentHumiditySensor(ApplianceEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _name_suffix = " Humidity"
+    name_suffix = " Humidity"
 
     def on_update(self) -> None:
         self._attr_native_value = self.dehumidifier().current_humidity
@@ -65,7 +65,7 @@ class CurrentTemperatureSensor(ApplianceEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _name_suffix = " Temperature"
+    name_suffix = " Temperature"
 
     def on_update(self) -> None:
         self._attr_native_value = self.dehumidifier().current_temperature
@@ -76,7 +76,7 @@ class TankLevelSensor(ApplianceEntity, SensorEntity):
 
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _name_suffix = " Water Level"
+    name_suffix = " Water Level"
 
     def on_online(self, update: bool) -> None:
         self._attr_entity_registry_enabled_default = (
@@ -95,7 +95,7 @@ class OutsideTemperatureSensor(ApplianceEntity, SensorEntity):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
     _unique_id_prefx = UNIQUE_CLIMATE_PREFIX
-    _name_suffix = " Outdoor Temperature"
+    name_suffix = " Outdoor Temperature"
 
     def on_update(self) -> None:
         self._attr_native_value = self.airconditioner().outdoor_temperature
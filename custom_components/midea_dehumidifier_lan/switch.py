@@ -164,7 +164,7 @@ class MideaSwitch(ApplianceEntity, SwitchEntity):
         self._switch_descriptor = descriptor
         self._capability_attr = descriptor.capability
         self._unique_id_prefix = descriptor.prefix
-        self._name_suffix = " " + descriptor.name.strip()
+        self.name_suffix = " " + descriptor.name.strip()
         super().__init__(coordinator)
 
         self._attr_icon = descriptor.icon
@@ -1,25 +1,44 @@
 """Test integration configuration flow"""
 # pylint: disable=unused-argument
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.const import (
+    CONF_API_VERSION,
+    CONF_DEVICES,
+    CONF_DISCOVERY,
+    CONF_ID,
+    CONF_IP_ADDRESS,
+    CONF_NAME,
     CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_TYPE,
+    CONF_UNIQUE_ID,
     CONF_USERNAME,
     CONF_INCLUDE,
     CONF_BROADCAST_ADDRESS,
 )
 from homeassistant.core import HomeAssistant
+from midea_beautiful.midea import APPLIANCE_TYPE_DEHUMIDIFIER
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
-from custom_components.midea_dehumidifier_lan.config_flow import MideaConfigFlow
+from custom_components.midea_dehumidifier_lan.config_flow import (
+    MideaConfigFlow,
+    _is_valid_ipv4,
+    _is_valid_ipv4_network,
+    _unique_by_address,
+)
 from custom_components.midea_dehumidifier_lan.const import (
     CONF_ADVANCED_SETTINGS,
     CONF_MOBILE_APP,
+    CONF_TOKEN_KEY,
     DEFAULT_APP,
+    DISCOVERY_CLOUD,
+    DISCOVERY_LAN,
     DOMAIN,
 )
+from custom_components.midea_dehumidifier_lan.util import MideaClient
 
 MOCK_BASIC_CONFIG_PAGE = {
     CONF_USERNAME: "test_username",
@@ -28,6 +47,53 @@ MOCK_BASIC_CONFIG_PAGE = {
 }
 
 
+def test_is_valid_ipv4():
+    """Test validation of IPv4 addresses"""
+    assert _is_valid_ipv4("192.0.2.1")
+    assert _is_valid_ipv4("0.0.0.0")
+    assert _is_valid_ipv4("255.255.255.255")
+    assert not _is_valid_ipv4("256.0.2.1")
+    assert not _is_valid_ipv4("192.0.02.1")
+    assert not _is_valid_ipv4("192.0.2")
+    assert not _is_valid_ipv4("192..0.2")
+    assert not _is_valid_ipv4("192.0.2.1.")
+    assert not _is_valid_ipv4("192.0.2.a")
+    assert not _is_valid_ipv4("")
+
+
+def test_is_valid_ipv4_network():
+    """Test validation of IPv4 networks"""
+    assert _is_valid_ipv4_network("192.0.2.255")
+    assert _is_valid_ipv4_network("192.0.2.0/24")
+    assert _is_valid_ipv4_network("0.0.0.0/0")
+    assert _is_valid_ipv4_network("192.0.2.0/255.255.255.0")
+    assert _is_valid_ipv4_network("192.0.2.0/0.0.0.255")
+    assert not _is_valid_ipv4_network("192.0.2.0/255.255.0.255")
+    assert not _is_valid_ipv4_network("192.0.2.1/255.255.255.0")
+    assert not _is_valid_ipv4_network("192.0.2.1/24")
+    assert not _is_valid_ipv4_network("192.0.2.0/33")
+    assert not _is_valid_ipv4_network("192.0.2.0/")
+    assert not _is_valid_ipv4_network("192.0.2.0/x")
+    assert not _is_valid_ipv4_network("655.123.123.333")
+
+
+def test_unique_by_address():
+    """Test removal of appliances reported on same address"""
+    first = Mock(address="192.0.2.1")
+    duplicate = Mock(address="192.0.2.1")
+    second = Mock(address="192.0.2.2")
+    unknown = Mock(address="0.0.0.0")
+    missing = Mock(address=None)
+    appliances = [first, duplicate, unknown, second, missing, unknown]
+    assert _unique_by_address(appliances) == [
+        first,
+        unknown,
+        second,
+        missing,
+        unknown,
+    ]
+
+
 async def test_show_form(hass):
     """Test that the form is served with no input."""
     flow = MideaConfigFlow()
@@ -93,7 +159,9 @@ async def test_successful_config_flow_midea_two_appliances_only_dehumidifier(
     assert result["result"]
 
 
-async def test_advanced_settings_config_flow(hass: HomeAssistant):
+async def test_advanced_settings_config_flow(
+    hass: HomeAssistant, midea_no_appliances
+):
     """Test a advanced settings config flow."""
     # Initialize a config flow
     result = await hass.config_entries.flow.async_init(
@@ -177,9 +245,48 @@ async def test_advanced_settings_config_flow_success_network(
     assert result["data"][CONF_BROADCAST_ADDRESS] == ["255.255.255.255", "192.0.2.255"]
     assert len(result["data"]["devices"]) == 1
     assert result["result"]
+    assert MideaClient.find_appliances.call_args[0][1] == [
+        "255.255.255.255",
+        "192.0.2.255",
+    ]
 
 
-async def test_advanced_settings_config_invalid_network(hass: HomeAssistant):
+async def test_advanced_settings_config_flow_broadcast_of_ranges(
+    hass: HomeAssistant, midea_single_appliances
+):
+    """Test that discovery broadcasts to last address of configured ranges."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input: dict[str, Any] = {**MOCK_BASIC_CONFIG_PAGE}
+    user_input[CONF_ADVANCED_SETTINGS] = True
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    user_input = {
+        CONF_USERNAME: "test_username",
+        CONF_PASSWORD: "test_password",
+        CONF_BROADCAST_ADDRESS: "192.0.2.0/24, 198.51.100.0/255.255.255.128",
+    }
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert result["data"][CONF_BROADCAST_ADDRESS] == [
+        "255.255.255.255",
+        "192.0.2.0/24",
+        "198.51.100.0/255.255.255.128",
+    ]
+    assert MideaClient.find_appliances.call_args[0][1] == [
+        "255.255.255.255",
+        "192.0.2.255",
+        "198.51.100.127",
+    ]
+
+
+async def test_advanced_settings_config_invalid_network(
+    hass: HomeAssistant, midea_no_appliances
+):
     """Test a advanced settings with invalid network."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -205,11 +312,81 @@ async def test_advanced_settings_config_invalid_network(hass: HomeAssistant):
     assert values[CONF_MOBILE_APP] == "NetHome Plus"
     assert values[CONF_BROADCAST_ADDRESS] == "655.123.123.333"
     assert result["description_placeholders"]
+    assert result["description_placeholders"].get("cause") == "655.123.123.333"
+    assert values[CONF_INCLUDE] == ["0xa1"]
+
+
+async def test_advanced_settings_reuses_prefetched_cloud(
+    hass: HomeAssistant, midea_single_appliances
+):
+    """Test that login done while advanced settings are shown is reused."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input: dict[str, Any] = {**MOCK_BASIC_CONFIG_PAGE}
+    user_input[CONF_ADVANCED_SETTINGS] = True
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={**MOCK_BASIC_CONFIG_PAGE}
+    )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert MideaClient.connect_to_cloud.call_count == 1
+
+
+async def test_advanced_settings_reuses_prefetched_cloud_other_app(
+    hass: HomeAssistant, midea_single_appliances
+):
+    """Test that login done with non-default app is reused."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input: dict[str, Any] = {**MOCK_BASIC_CONFIG_PAGE}
+    user_input[CONF_MOBILE_APP] = "MSmartHome"
+    user_input[CONF_ADVANCED_SETTINGS] = True
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
+    values = result["data_schema"]({})
+    assert values[CONF_MOBILE_APP] == "MSmartHome"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_USERNAME: MOCK_BASIC_CONFIG_PAGE[CONF_USERNAME],
+            CONF_PASSWORD: MOCK_BASIC_CONFIG_PAGE[CONF_PASSWORD],
+        },
+    )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert result["data"][CONF_MOBILE_APP] == "MSmartHome"
+    assert MideaClient.connect_to_cloud.call_count == 1
+
+
+async def test_advanced_settings_discards_prefetched_cloud(
+    hass: HomeAssistant, midea_single_appliances
+):
+    """Test that login done while advanced settings are shown is discarded
+    if credentials are changed."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input: dict[str, Any] = {**MOCK_BASIC_CONFIG_PAGE}
+    user_input[CONF_ADVANCED_SETTINGS] = True
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    user_input = {**MOCK_BASIC_CONFIG_PAGE}
+    user_input[CONF_PASSWORD] = "other_password"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert MideaClient.connect_to_cloud.call_count == 2
     assert (
-        result["description_placeholders"].get("cause")
-        == "Octet 655 (> 255) not permitted in '655.123.123.333'"
+        MideaClient.connect_to_cloud.call_args[0][0][CONF_PASSWORD] == "other_password"
     )
-    assert values[CONF_INCLUDE] == ["0xa1"]
 
 
 async def test_advanced_settings_config_flow_success_use_cloud(
@@ -360,3 +537,82 @@ async def test_step_reauth_invalid_password(hass: HomeAssistant, midea_invalid_a
         assert result["step_id"] == "reauth_confirm"
 
     assert len(hass.config_entries.async_entries()) == 1
+
+
+def _setup_options_entry(hass: HomeAssistant, appliance, discovery: str):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="test_username",
+        data={
+            **MOCK_BASIC_CONFIG_PAGE,
+            CONF_INCLUDE: [APPLIANCE_TYPE_DEHUMIDIFIER],
+            CONF_DEVICES: [
+                {
+                    CONF_API_VERSION: 3,
+                    CONF_DISCOVERY: discovery,
+                    CONF_ID: appliance.appliance_id,
+                    CONF_IP_ADDRESS: appliance.address,
+                    CONF_NAME: appliance.name,
+                    CONF_TOKEN: appliance.token,
+                    CONF_TOKEN_KEY: appliance.key,
+                    CONF_TYPE: APPLIANCE_TYPE_DEHUMIDIFIER,
+                    CONF_UNIQUE_ID: appliance.serial_number,
+                }
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+    appliance.online = True
+    coordinator = Mock(available=True, appliance=appliance)
+    hass.data[DOMAIN] = {entry.entry_id: Mock(coordinators=[coordinator])}
+    return entry
+
+
+async def test_options_flow_skips_probe_of_online_appliance(
+    hass: HomeAssistant, midea_single_appliances, dehumidifier_mock
+):
+    """Test that appliance online over LAN is not probed again if unchanged."""
+    entry = _setup_options_entry(hass, dehumidifier_mock, DISCOVERY_LAN)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
+    assert result["step_id"] == "appliance"
+
+    with patch("homeassistant.config_entries.ConfigEntries.async_reload"):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_DISCOVERY: DISCOVERY_LAN,
+                CONF_IP_ADDRESS: dehumidifier_mock.address,
+                CONF_NAME: dehumidifier_mock.name,
+                CONF_TOKEN: dehumidifier_mock.token,
+                CONF_TOKEN_KEY: dehumidifier_mock.key,
+            },
+        )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert MideaClient.connect_to_cloud.call_count == 0
+    assert MideaClient.appliance_state.call_count == 0
+
+
+async def test_options_flow_probes_appliance_switched_to_lan(
+    hass: HomeAssistant, midea_single_appliances, dehumidifier_mock
+):
+    """Test that appliance polled through cloud is probed when switched to LAN."""
+    dehumidifier_mock.token = ""
+    dehumidifier_mock.key = ""
+    entry = _setup_options_entry(hass, dehumidifier_mock, DISCOVERY_CLOUD)
+    MideaClient.appliance_state.return_value = dehumidifier_mock
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    with patch("homeassistant.config_entries.ConfigEntries.async_reload"):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_DISCOVERY: DISCOVERY_LAN,
+                CONF_IP_ADDRESS: dehumidifier_mock.address,
+                CONF_NAME: dehumidifier_mock.name,
+            },
+        )
+    assert result["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert MideaClient.appliance_state.call_count == 1
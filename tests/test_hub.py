@@ -1,6 +1,9 @@
 """Test integration configuration flow"""
 # pylint: disable=unused-argument
 
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
 from homeassistant.const import (
     CONF_API_VERSION,
     CONF_DEVICES,
@@ -9,23 +12,35 @@ from homeassistant.const import (
     CONF_IP_ADDRESS,
     CONF_NAME,
     CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
     CONF_TOKEN,
     CONF_TYPE,
     CONF_UNIQUE_ID,
     CONF_USERNAME,
 )
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from midea_beautiful.exceptions import AuthenticationError
+from midea_beautiful.midea import APPLIANCE_TYPE_DEHUMIDIFIER
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.midea_dehumidifier_lan.const import (
+    CONF_MOBILE_APP,
     CONF_TOKEN_KEY,
+    DEFAULT_APP,
     DISCOVERY_CLOUD,
     DISCOVERY_IGNORE,
     DISCOVERY_LAN,
     DISCOVERY_WAIT,
+    DOMAIN,
+    UNKNOWN_IP,
 )
 from custom_components.midea_dehumidifier_lan.hub import (
+    Hub,
     _assure_valid_device_configuration,
 )
-from custom_components.midea_dehumidifier_lan.util import RedactedConf
+from custom_components.midea_dehumidifier_lan.util import MideaClient, RedactedConf
 
 
 def test_redact():
@@ -147,3 +162,78 @@ def test_assure_valid_device_configuration():
     valid = _assure_valid_device_configuration(conf, conf[CONF_DEVICES][5])
     assert not valid
     assert conf[CONF_DEVICES][5][CONF_DISCOVERY] == DISCOVERY_IGNORE
+
+
+def _cloud_config_entry(count: int) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "test_username",
+            CONF_PASSWORD: "test_password",
+            CONF_MOBILE_APP: DEFAULT_APP,
+            CONF_SCAN_INTERVAL: 0,
+            CONF_DEVICES: [
+                {
+                    CONF_ID: f"65432{i}",
+                    CONF_UNIQUE_ID: f"SN65432{i}",
+                    CONF_NAME: f"Test Name {i}",
+                    CONF_TYPE: APPLIANCE_TYPE_DEHUMIDIFIER,
+                    CONF_API_VERSION: 3,
+                    CONF_DISCOVERY: DISCOVERY_CLOUD,
+                    CONF_IP_ADDRESS: UNKNOWN_IP,
+                }
+                for i in range(count)
+            ],
+        },
+    )
+
+
+async def test_hub_setup_probes_in_parallel(hass: HomeAssistant):
+    """Test that appliances are probed concurrently with a single cloud login"""
+    # Each probe waits for the other one, so they succeed only if run in parallel
+    barrier = threading.Barrier(2, timeout=5)
+    logins = []
+
+    # Plain functions, not mocks, so that test harness runs them in executor
+    def connect_to_cloud(self, conf):
+        logins.append(conf[CONF_USERNAME])
+        return MagicMock()
+
+    def appliance_state(self, *args, **kwargs):
+        barrier.wait()
+        return MagicMock()
+
+    with patch.multiple(
+        MideaClient,
+        connect_to_cloud=connect_to_cloud,
+        appliance_state=appliance_state,
+        find_appliances=Mock(return_value=[]),
+    ):
+        hub = Hub(hass, _cloud_config_entry(2))
+        await hub.async_setup()
+
+        assert hub.errors == {}
+        assert logins == ["test_username"]
+        assert [coordinator.device[CONF_ID] for coordinator in hub.coordinators] == [
+            "654320",
+            "654321",
+        ]
+        assert all(coordinator.available for coordinator in hub.coordinators)
+        await hub.async_unload()
+
+
+async def test_hub_setup_invalid_auth(hass: HomeAssistant):
+    """Test that rejected cloud login aborts set-up of all appliances"""
+    with patch.multiple(
+        MideaClient,
+        connect_to_cloud=Mock(side_effect=AuthenticationError("invalid password")),
+        appliance_state=Mock(),
+        find_appliances=Mock(return_value=[]),
+    ):
+        hub = Hub(hass, _cloud_config_entry(3))
+        with pytest.raises(ConfigEntryAuthFailed):
+            await hub.async_setup()
+
+        assert MideaClient.connect_to_cloud.call_count == 1
+        assert MideaClient.appliance_state.call_count == 0
+        assert hub.coordinators == []